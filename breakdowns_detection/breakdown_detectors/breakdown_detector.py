@@ -1,15 +1,72 @@
 """Interface defining a breakdown detection component."""
 
+import hashlib
+import inspect
 import logging
+import sys
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from typing import DefaultDict, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    Any,
+    Counter,
+    DefaultDict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
 
 import nltk
 import pandas as pd
 from dialoguekit.core.dialogue import Dialogue
+from dialoguekit.participant import DialogueParticipant
 from tabulate import tabulate
 
+logger = logging.getLogger(__name__)
+
+# Version of the cached breakdowns format, to increment when it changes.
+_CACHE_VERSION = 1
+
+# Dialogue readers store participants as names, e.g., "AGENT", instead of
+# DialogueParticipant members.
+_AGENT_NAME = DialogueParticipant.AGENT.name
+
+
+def serialize_intents(dialogue: Dialogue) -> Tuple[str]:
+    """Serializes the intents of a dialogue.
+
+    The sequence is cached on the dialogue so that it is built only once per
+    dialogue, regardless of the number of detectors using it. The cache is
+    invalidated if utterances are added to the dialogue. Intents are interned
+    as sequences are used as keys when counting breakdowns.
+
+    Args:
+        dialogue: Dialogue.
+
+    Returns:
+        Sequence of intents. Agent's intents are prefixed with A_ and user's
+        intents with U_.
+    """
+    num_utterances = len(dialogue.utterances)
+    cached = getattr(dialogue, "_cached_intent_sequence", None)
+    if cached is not None and cached[0] == num_utterances:
+        return cached[1]
+
+    intents: List[str] = []
+    agent_name = _AGENT_NAME
+    append_intent = intents.append
+    intern = sys.intern
+    for utterance in dialogue.utterances:
+        if utterance.participant == agent_name:
+            append_intent(intern(f"A_{utterance.intent.label}"))
+        else:
+            append_intent(intern(f"U_{utterance.intent.label}"))
+
+    dialogue._cached_intent_sequence = (num_utterances, tuple(intents))
+    return dialogue._cached_intent_sequence[1]
+
 
 class BreakdownDetector(ABC):
     def __init__(self, breakdown_name: str) -> None:
@@ -25,6 +82,37 @@ class BreakdownDetector(ABC):
         """Returns the name of the breakdown detected."""
         return self._breakdown_name
 
+    def get_cache_key(self) -> Optional[str]:
+        """Returns a key identifying the detector and its configuration.
+
+        Detected breakdowns can be cached across runs with this key. It
+        includes the source code of the detector's modules so that changes to
+        the detection logic invalidate cached results.
+
+        Returns:
+            Hash of the detector's configuration and source code, or None if
+            the source code is not available, e.g., for detectors defined in
+            __main__ or installed without source files.
+        """
+        sha256 = hashlib.sha256()
+        sha256.update(f"{_CACHE_VERSION}:{self._get_config()!r}".encode())
+        try:
+            for cls in type(self).__mro__:
+                if issubclass(cls, BreakdownDetector):
+                    with open(inspect.getfile(cls), "rb") as f:
+                        sha256.update(f.read())
+        except (OSError, TypeError):
+            return None
+        return sha256.hexdigest()
+
+    def _get_config(self) -> Tuple[Any, ...]:
+        """Returns the configuration affecting the detected breakdowns.
+
+        Returns:
+            Configuration of the detector.
+        """
+        return (type(self).__name__, self._breakdown_name)
+
     @abstractmethod
     def detect_breakdown(self, dialogue: Dialogue) -> Tuple[str]:
         """Detects breakdown in a given dialogue.
@@ -42,55 +130,73 @@ class BreakdownDetector(ABC):
         raise NotImplementedError
 
     def detect_breakdowns(
-        self, dialogues: List[Dialogue]
+        self, dialogues: List[Dialogue], n_workers: int = 1
     ) -> DefaultDict[Tuple[str], int]:
         """Detects breakdown dialogues.
 
         Args:
             dialogues: Dialogues.
+            n_workers: Number of processes used to detect breakdowns. If set
+              to 1, dialogues are processed in the current process. Defaults
+              to 1.
 
         Returns:
             Count of breakdowns per sequence of intents.
         """
+        sequences: Iterable[Tuple[str]]
+        if n_workers > 1:
+            chunksize = max(1, len(dialogues) // (n_workers * 4))
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                sequences = list(
+                    executor.map(
+                        self.detect_breakdown, dialogues, chunksize=chunksize
+                    )
+                )
+        else:
+            sequences = map(self.detect_breakdown, dialogues)
+
         breakdowns = defaultdict(int)
-        for dialogue in dialogues:
-            logging.debug(
-                f"breakdown detected:{self.detect_breakdown(dialogue)}"
-            )
-            seq = self.detect_breakdown(dialogue)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for seq in sequences:
+            if debug:
+                logger.debug("breakdown detected:%s", seq)
             if seq:
                 breakdowns[seq] += 1
         return breakdowns
 
     def _find_conversational_patterns(
-        self, breakdowns: List[List[str]], n: int = 3
+        self, breakdowns: Mapping[Tuple[str], int], n: int = 3
     ) -> pd.DataFrame:
         """Finds problematic conversational patterns based on detected breakdowns.
 
         Args:
-            breakdowns: Sequences of intents leading to breakdown.
+            breakdowns: Count of breakdowns per sequence of intents.
             n: Maximum length of intent sequences (conversational patterns).
               Defaults to 3.
 
         Returns:
-            List of problematic conversational patterns and their number of
-            occurrence.
+            List of problematic conversational patterns and the number of
+            breakdowns containing them.
         """
-        sequences = [" ".join(breakdown) for breakdown in breakdowns]
-
-        df = pd.DataFrame()
-        for i in range(2, n + 1):
-            df = pd.concat(
-                [df, pd.Series(nltk.ngrams(sequences, i)).value_counts()],
-                axis=0,
-            )
-        return df
+        patterns: Counter[Tuple[str, ...]] = Counter()
+        for breakdown, count in breakdowns.items():
+            # A pattern is counted once per breakdown containing it.
+            breakdown_patterns = set()
+            for i in range(2, n + 1):
+                breakdown_patterns.update(nltk.ngrams(breakdown, i))
+            for pattern in breakdown_patterns:
+                patterns[pattern] += count
+
+        df = pd.DataFrame.from_dict(patterns, orient="index", columns=["Count"])
+        df.index.set_names(["Conversational pattern"], inplace=True)
+        return df.sort_values("Count", ascending=False)
 
     def get_breakdown_summary(
         self,
-        breakdowns: DefaultDict[List[str], int],
+        breakdowns: DefaultDict[Tuple[str], int],
         n: int = 3,
         output_file: str = None,
+        writer: pd.ExcelWriter = None,
     ) -> pd.DataFrame:
         """Returns a summary of the detected breakdowns in a given dialogue.
 
@@ -102,6 +208,9 @@ class BreakdownDetector(ABC):
               Defaults to 3.
             output_file: Path to the output file to save the report. If set to
               None, the report is printed in the console. Defaults to None.
+            writer: Excel writer to save the report with, useful to save the
+              reports of several detectors in one go. It takes precedence over
+              output_file. Defaults to None.
 
         Returns:
             Report of the detected breakdowns.
@@ -113,11 +222,11 @@ class BreakdownDetector(ABC):
         )
         full_breakdowns.index.set_names(["Sequence of intents"], inplace=True)
 
-        summary_table = self._find_conversational_patterns(
-            list(breakdowns.keys()), n=n
-        )
+        summary_table = self._find_conversational_patterns(breakdowns, n=n)
 
-        if output_file:
+        if writer is not None:
+            full_breakdowns.to_excel(writer, sheet_name=self._breakdown_name)
+        elif output_file:
             with pd.ExcelWriter(
                 output_file,
                 mode="a",
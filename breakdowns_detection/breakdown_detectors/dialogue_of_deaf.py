@@ -5,15 +5,25 @@ consecutive. This breakdown can indicate a pitfall in the dialogue policy from
 which the conversational agent cannot escape.
 """
 
-import statistics
+from collections import deque
 from difflib import SequenceMatcher
-from typing import List, Tuple
+from typing import Any, DefaultDict, Deque, Dict, List, Tuple
 
 from dialoguekit.core.dialogue import Dialogue
 from dialoguekit.core.utterance import Utterance
-from dialoguekit.participant import DialogueParticipant
 
-from .breakdown_detector import BreakdownDetector
+from .breakdown_detector import (
+    _AGENT_NAME,
+    BreakdownDetector,
+    serialize_intents,
+)
+
+# Minimum resemblance between three consecutive agent utterances to be
+# considered identical.
+_RESEMBLANCE_THRESHOLD = 0.9
+
+# Maximum number of exact similarity ratios cached by a detector.
+_MAX_CACHED_RATIOS = 10000
 
 
 class DialogueOfDeafDetector(BreakdownDetector):
@@ -25,6 +35,36 @@ class DialogueOfDeafDetector(BreakdownDetector):
               Dialogue of deaf".
         """
         super().__init__(breakdown_name)
+        # Exact similarity ratios per pair of texts. Agents often reuse the
+        # same templated replies across dialogues. The cache is reset for each
+        # set of dialogues and bounded in size.
+        self._ratios: Dict[Tuple[str, str], float] = {}
+
+    def _get_config(self) -> Tuple[Any, ...]:
+        """Returns the configuration affecting the detected breakdowns.
+
+        Returns:
+            Configuration of the detector, including the resemblance
+            threshold.
+        """
+        return super()._get_config() + (_RESEMBLANCE_THRESHOLD,)
+
+    def detect_breakdowns(
+        self, dialogues: List[Dialogue], n_workers: int = 1
+    ) -> DefaultDict[Tuple[str], int]:
+        """Detects dialogue of deaf breakdowns.
+
+        Args:
+            dialogues: Dialogues.
+            n_workers: Number of processes used to detect breakdowns. Defaults
+              to 1.
+
+        Returns:
+            Count of breakdowns per sequence of intents.
+        """
+        # Clearing the cache also avoids sending it to the worker processes.
+        self._ratios.clear()
+        return super().detect_breakdowns(dialogues, n_workers=n_workers)
 
     def detect_breakdown(self, dialogue: Dialogue) -> Tuple[str]:
         """Detects dialogue of deaf breakdown in a given dialogue.
@@ -38,53 +78,44 @@ class DialogueOfDeafDetector(BreakdownDetector):
         Returns:
             Intent sequence leading to the breakdown.
         """
-        intent_sequence = ()
-
         # Check if the dialogue ended because of a recursion error
         error = dialogue.metadata.get("error", {}).get("error_type", None)
         if error is not None and error != "RecursionError":
-            for utterance in dialogue.utterances:
-                if utterance.participant == DialogueParticipant.AGENT.name:
-                    intent_sequence = intent_sequence + (
-                        f"A_{utterance.intent.label}",
-                    )
-                else:
-                    intent_sequence = intent_sequence + (
-                        f"U_{utterance.intent.label}",
-                    )
-            return intent_sequence
-
-        agent_utterances = [
-            utterance
-            for utterance in dialogue.utterances
-            if utterance.participant == DialogueParticipant.AGENT.name
-        ]
-        sequence_matcher = SequenceMatcher()
-        for i in range(len(agent_utterances) - 2):
-            same_intent = (
-                agent_utterances[i].intent.label
-                == agent_utterances[i + 1].intent.label
-                == agent_utterances[i + 2].intent.label
-            )
+            return serialize_intents(dialogue)
+
+        agent_utterances = (
+            (position, utterance)
+            for position, utterance in enumerate(dialogue.utterances)
+            if utterance.participant == _AGENT_NAME
+        )
+        # Sliding window over the three last agent utterances and their
+        # positions in the dialogue.
+        window: Deque[Tuple[int, Utterance]] = deque(maxlen=3)
+        # Unlike difflib's default, the autojunk heuristic is disabled so that
+        # frequent characters of utterances longer than 200 characters are not
+        # ignored. Resemblances of such utterances differ from the ones
+        # computed with the heuristic.
+        sequence_matcher = SequenceMatcher(autojunk=False)
+        for position, agent_utterance in agent_utterances:
+            window.append((position, agent_utterance))
+            if len(window) < 3:
+                continue
+
+            (start, first), (_, second), (_, third) = window
+            label = first.intent.label
+            # The resemblance is only computed for utterances with the same
+            # intent.
+            if label != second.intent.label or label != third.intent.label:
+                continue
+
             resemblance = self._compute_utterance_resemblance(
-                agent_utterances[i],
-                agent_utterances[i + 1 : i + 3],
-                sequence_matcher,
+                first, [second, third], sequence_matcher
             )
-            if same_intent and resemblance >= 0.9:
-                # An agent is always followed by a user utterance.
-                for utterance in dialogue.utterances[: i * 2]:
-                    if utterance.participant == DialogueParticipant.AGENT.name:
-                        intent_sequence = intent_sequence + (
-                            f"A_{utterance.intent.label}",
-                        )
-                    else:
-                        intent_sequence = intent_sequence + (
-                            f"U_{utterance.intent.label}",
-                        )
-                #
-                return intent_sequence
-        return intent_sequence
+            if resemblance >= _RESEMBLANCE_THRESHOLD:
+                # The intents are serialized once per dialogue, the breakdown
+                # is the sequence before the first repeated utterance.
+                return serialize_intents(dialogue)[:start]
+        return ()
 
     def _compute_utterance_resemblance(
         self,
@@ -101,11 +132,79 @@ class DialogueOfDeafDetector(BreakdownDetector):
             sequence_matcher: Sequence matcher.
 
         Returns:
-            Resemblance between three consecutive agent utterances.
+            Resemblance between three consecutive agent utterances. If it
+            cannot reach the threshold, a value below the threshold is returned
+            without computing the exact resemblance.
+        """
+        # The utterance is set as the second sequence of the matcher as
+        # difflib caches information about it, which is reused for both
+        # comparisons. Note that the ratio is not symmetric, so resemblances
+        # may differ slightly from comparing the sequences in reverse order.
+        text = utterance.text
+        min_resemblance = 2 * _RESEMBLANCE_THRESHOLD - 1
+        if text == previous_utterances[0].text:
+            resemblance1 = 1.0
+        else:
+            resemblance1 = self._compute_ratio(
+                previous_utterances[0].text,
+                text,
+                sequence_matcher,
+                min_resemblance,
+            )
+
+        # The mean cannot reach the threshold even if resemblance2 is 1.0.
+        if resemblance1 < min_resemblance:
+            return resemblance1
+
+        if text == previous_utterances[-1].text:
+            resemblance2 = 1.0
+        else:
+            resemblance2 = self._compute_ratio(
+                previous_utterances[-1].text,
+                text,
+                sequence_matcher,
+                2 * _RESEMBLANCE_THRESHOLD - resemblance1,
+            )
+        return (resemblance1 + resemblance2) * 0.5
+
+    def _compute_ratio(
+        self,
+        text1: str,
+        text2: str,
+        sequence_matcher: SequenceMatcher,
+        min_ratio: float,
+    ) -> float:
+        """Computes the similarity ratio between two texts.
+
+        The cheap upper bounds of the ratio are checked first, so the exact
+        ratio is only computed if it can reach the minimum ratio. Exact ratios
+        are cached per pair of texts.
+
+        Args:
+            text1: First text, set as the first sequence of the matcher.
+            text2: Second text, set as the second sequence of the matcher.
+            sequence_matcher: Sequence matcher.
+            min_ratio: Minimum ratio of interest.
+
+        Returns:
+            Similarity ratio, or an upper bound of it if it is below the
+            minimum ratio.
         """
-        sequence_matcher.set_seqs(utterance.text, previous_utterances[0].text)
-        resemblance1 = sequence_matcher.ratio()
-        sequence_matcher.set_seqs(utterance.text, previous_utterances[-1].text)
-        resemblance2 = sequence_matcher.ratio()
-        resemblance = statistics.mean([resemblance1, resemblance2])
-        return resemblance
+        texts = (text1, text2)
+        ratio = self._ratios.get(texts)
+        if ratio is not None:
+            return ratio
+
+        sequence_matcher.set_seq2(text2)
+        sequence_matcher.set_seq1(text1)
+
+        upper_bound = sequence_matcher.real_quick_ratio()
+        if upper_bound < min_ratio:
+            return upper_bound
+        upper_bound = sequence_matcher.quick_ratio()
+        if upper_bound < min_ratio:
+            return upper_bound
+        ratio = sequence_matcher.ratio()
+        if len(self._ratios) < _MAX_CACHED_RATIOS:
+            self._ratios[texts] = ratio
+        return ratio
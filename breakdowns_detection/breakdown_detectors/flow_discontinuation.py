@@ -7,13 +7,12 @@ to an utterance that was received at least two utterances before, and utterance
 with a dialogue act that mismatches the dialogue policy.
 """
 
-from typing import Tuple
+from typing import Any, Dict, FrozenSet, Tuple
 
 import networkx as nx
 from dialoguekit.core.dialogue import Dialogue
-from dialoguekit.participant import DialogueParticipant
 
-from .breakdown_detector import BreakdownDetector
+from .breakdown_detector import BreakdownDetector, serialize_intents
 
 
 class FlowDiscontinuationDetector(BreakdownDetector):
@@ -31,6 +30,23 @@ class FlowDiscontinuationDetector(BreakdownDetector):
         """
         super().__init__(breakdown_name)
         self._dialogue_flow = dialogue_flow
+        # Snapshot of the dialogue flow adjacency, which is read-only during
+        # detection.
+        self._successors: Dict[str, FrozenSet[str]] = {
+            node: frozenset(dialogue_flow.successors(node))
+            for node in dialogue_flow
+        }
+
+    def _get_config(self) -> Tuple[Any, ...]:
+        """Returns the configuration affecting the detected breakdowns.
+
+        Returns:
+            Configuration of the detector, including the dialogue flow.
+        """
+        return super()._get_config() + (
+            sorted(self._dialogue_flow.nodes),
+            sorted(self._dialogue_flow.edges),
+        )
 
     def detect_breakdown(self, dialogue: Dialogue) -> Tuple[str]:
         """Detects flow discontinuation breakdowns in a given dialogue.
@@ -41,15 +57,30 @@ class FlowDiscontinuationDetector(BreakdownDetector):
         Returns:
             Intent sequence leading to the breakdown.
         """
+        successors = self._successors
         path = []
-        for utterance in dialogue.utterances:
-            intents = utterance.intent.label.split("+")
-            if utterance.participant == DialogueParticipant.AGENT.name:
-                path.extend([f"A_{intent}" for intent in intents])
+        previous_node = None
+        for prefixed_intent in serialize_intents(dialogue):
+            # Utterances with multiple intents, e.g., "A_INTENT1+INTENT2",
+            # correspond to multiple nodes in the dialogue flow.
+            if "+" in prefixed_intent:
+                prefix = prefixed_intent[:2]
+                nodes = [
+                    prefix + intent for intent in prefixed_intent[2:].split("+")
+                ]
             else:
-                path.extend([f"U_{intent}" for intent in intents])
+                nodes = [prefixed_intent]
+            path.extend(nodes)
 
-            if not nx.is_path(self._dialogue_flow, path):
-                return tuple(path)
+            # The path up to the previous utterance is valid, only the new
+            # nodes and edges need to be checked. Unknown intents are reported
+            # as soon as they occur, including in the first utterance.
+            for node in nodes:
+                if node not in successors or (
+                    previous_node is not None
+                    and node not in successors[previous_node]
+                ):
+                    return tuple(path)
+                previous_node = node
 
         return ()
@@ -3,9 +3,8 @@
 from typing import Tuple
 
 from dialoguekit.core.dialogue import Dialogue
-from dialoguekit.participant import DialogueParticipant
 
-from .breakdown_detector import BreakdownDetector
+from .breakdown_detector import BreakdownDetector, serialize_intents
 
 
 class SystemFailureDetector(BreakdownDetector):
@@ -31,19 +30,10 @@ class SystemFailureDetector(BreakdownDetector):
         Returns:
             Intent sequence leading to the breakdown.
         """
-        intent_sequence = ()
         # Check if the dialogue has a system error. In the future, a further
         # analysis of the error trace can be done to draw more insights.
         error = dialogue.metadata.get("error", {}).get("error_type", None)
         if error is not None and error != "RecursionError":
-            for utterance in dialogue.utterances:
-                if utterance.participant == DialogueParticipant.AGENT.name:
-                    intent_sequence = intent_sequence + (
-                        f"A_{utterance.intent.label}",
-                    )
-                else:
-                    intent_sequence = intent_sequence + (
-                        f"U_{utterance.intent.label}",
-                    )
-
-        return intent_sequence
+            return serialize_intents(dialogue)
+
+        return ()
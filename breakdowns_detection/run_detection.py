@@ -5,16 +5,28 @@ creates a summary of the results.
 """
 
 import argparse
+import hashlib
 import json
 import logging
+import os
+import pickle
+import tempfile
 import time
-from typing import List
+from contextlib import nullcontext
+from typing import Any, DefaultDict, List, Tuple
 
 import matplotlib.pyplot as plt
 import networkx as nx
+import pandas as pd
+from dialoguekit.core.dialogue import Dialogue
 from dialoguekit.utils.dialogue_reader import json_to_dialogues
 from pyvis.network import Network
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from breakdowns_detection.breakdown_detectors import (
     BreakdownDetector,
     DialogueOfDeafDetector,
@@ -29,6 +41,8 @@ logging.basicConfig(
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+_CACHE_DIR = ".cache/breakdowns"
+
 
 def main(args: argparse.Namespace) -> None:
     """Runs the breakdown detection components and saves a summary of detected
@@ -44,9 +58,7 @@ def main(args: argparse.Namespace) -> None:
         f"Loaded {len(dialogues)} dialogues from {args.dialogues_path}"
     )
 
-    dialogue_flow = nx.node_link_graph(
-        json.load(open(args.dialogue_flow, "r"))
-    )
+    dialogue_flow = nx.node_link_graph(_load_json(args.dialogue_flow))
     logger.info(f"Dialogue flow loaded from {args.dialogue_flow}")
     if args.debug:
         logger.info(
@@ -59,15 +71,22 @@ def main(args: argparse.Namespace) -> None:
         dialogue_flow=dialogue_flow, components_names=args.breakdown_components
     )
 
+    # Detected breakdowns are cached per detector configuration and
+    # dialogues file content.
+    dialogues_hash = (
+        None if args.debug or args.no_cache else _hash_file(args.dialogues_path)
+    )
+
+    breakdowns_per_detector = []
     breakdown_count = {}
     for breakdown_detector in breakdown_detectors:
         logger.info(f"Running {breakdown_detector.breakdown_name}")
-        breakdowns = breakdown_detector.detect_breakdowns(dialogues)
-        summary = breakdown_detector.get_breakdown_summary(
-            breakdowns, args.n, args.output_file
+        breakdowns = _detect_breakdowns(
+            breakdown_detector, dialogues, dialogues_hash, args.n_workers
         )
-        breakdown_count[breakdown_detector.breakdown_name] = (
-            summary["Count"].sum() if not summary.empty else 0
+        breakdowns_per_detector.append((breakdown_detector, breakdowns))
+        breakdown_count[breakdown_detector.breakdown_name] = sum(
+            breakdowns.values()
         )
 
     # Plot number of breakdowns per breakdown type
@@ -75,9 +94,113 @@ def main(args: argparse.Namespace) -> None:
     plt.title("Number of breakdowns per breakdown type")
     plt.xlabel("Breakdown type")
     plt.ylabel("Number of breakdowns")
-    plt.savefig(f"data/figures/breakdowns_per_type_{time.time()}.png")
+    figure_path = f"data/figures/breakdowns_per_type_{time.time()}.png"
+    os.makedirs(os.path.dirname(figure_path), exist_ok=True)
+    plt.savefig(figure_path)
     logging.info(f"Breakdown count: {breakdown_count}")
 
+    # The summaries of all detectors are saved with a single writer to avoid
+    # rewriting the output file for each detector.
+    with (
+        pd.ExcelWriter(args.output_file, mode="w", engine="openpyxl")
+        if args.output_file
+        else nullcontext()
+    ) as writer:
+        for breakdown_detector, breakdowns in breakdowns_per_detector:
+            breakdown_detector.get_breakdown_summary(
+                breakdowns, args.n, writer=writer
+            )
+
+
+def _detect_breakdowns(
+    breakdown_detector: BreakdownDetector,
+    dialogues: List[Dialogue],
+    dialogues_hash: str = None,
+    n_workers: int = 1,
+) -> DefaultDict[Tuple[str], int]:
+    """Detects breakdowns, reusing the results of a previous run if cached.
+
+    Args:
+        breakdown_detector: Breakdown detector.
+        dialogues: Dialogues.
+        dialogues_hash: Hash of the dialogues file. If set to None, the
+          results are not cached. Defaults to None.
+        n_workers: Number of processes used to detect breakdowns. Defaults to
+          1.
+
+    Returns:
+        Count of breakdowns per sequence of intents.
+    """
+    cache_key = None
+    if dialogues_hash is not None:
+        cache_key = breakdown_detector.get_cache_key()
+    if cache_key is None:
+        return breakdown_detector.detect_breakdowns(
+            dialogues, n_workers=n_workers
+        )
+
+    # The cache is best-effort: failures to read or write it never abort the
+    # detection.
+    cache_file = os.path.join(_CACHE_DIR, f"{cache_key}_{dialogues_hash}.pkl")
+    if os.path.exists(cache_file):
+        try:
+            with open(cache_file, "rb") as f:
+                breakdowns = pickle.load(f)
+            logger.info(f"Loaded cached breakdowns from {cache_file}")
+            return breakdowns
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache file {cache_file}: {e}")
+
+    breakdowns = breakdown_detector.detect_breakdowns(
+        dialogues, n_workers=n_workers
+    )
+    # The cache file is written atomically so that an interrupted run does not
+    # leave a truncated file behind.
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        fd, tmp_file = tempfile.mkstemp(dir=_CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(breakdowns, f)
+            os.replace(tmp_file, cache_file)
+        except BaseException:
+            os.remove(tmp_file)
+            raise
+    except OSError as e:
+        logger.warning(f"Could not cache breakdowns in {cache_file}: {e}")
+    return breakdowns
+
+
+def _hash_file(path: str) -> str:
+    """Computes the SHA-256 hash of a file.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        Hexadecimal digest of the file content.
+    """
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def _load_json(path: str) -> Any:
+    """Loads a JSON file, using orjson if it is installed.
+
+    Args:
+        path: Path to the JSON file.
+
+    Returns:
+        Content of the JSON file.
+    """
+    with open(path, "rb") as f:
+        if orjson is not None:
+            return orjson.loads(f.read())
+        return json.load(f)
+
 
 def _visualize_flow(dialogue_flow: nx.DiGraph) -> None:
     """Visualizes the dialogue flow.
@@ -127,6 +250,29 @@ def _create_breakdown_detectors(
     return detectors
 
 
+def _positive_int(value: str) -> int:
+    """Parses a strictly positive integer argument.
+
+    Args:
+        value: Argument value.
+
+    Returns:
+        Parsed integer.
+
+    Raises:
+        ArgumentTypeError: If the value is not a strictly positive integer.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(
+            f"{value} is not a strictly positive integer"
+        )
+    return number
+
+
 def parse_args() -> argparse.Namespace:
     """Defines accepted arguments and returns the parsed values.
 
@@ -167,6 +313,18 @@ def parse_args() -> argparse.Namespace:
         default=3,
         help="Maximum length of the conversational pattern in summary.",
     )
+    parser.add_argument(
+        "--n-workers",
+        type=_positive_int,
+        default=1,
+        help="Number of processes used to detect breakdowns. Defaults to 1.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not reuse nor cache detected breakdowns. Caching is also "
+        "disabled in debug mode.",
+    )
     parser.add_argument(
         "--debug",
         action="store_true",